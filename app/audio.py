@@ -0,0 +1,24 @@
+import io
+import torch
+import torchaudio
+
+SAMPLE_RATE = 16000
+
+
+def load_audio(audio_bytes, device="cpu"):
+    """Decode audio bytes into the mono 16 kHz form shared by STT and diarization.
+
+    Returns a pyannote-style ``{"waveform": (1, time) tensor, "sample_rate": 16000}``
+    dict. Resampling runs on `device`; pass "cuda" when a consumer runs there.
+    Falls back to CPU when torch cannot see a GPU.
+    """
+    # Decode straight from memory; no temp file round-trip
+    waveform, rate = torchaudio.load(io.BytesIO(audio_bytes))
+
+    if device != "cpu" and torch.cuda.is_available():
+        waveform = waveform.to(device)
+
+    if rate != SAMPLE_RATE:
+        waveform = torchaudio.functional.resample(waveform, rate, SAMPLE_RATE)
+
+    return {"waveform": waveform.mean(dim=0, keepdim=True), "sample_rate": SAMPLE_RATE}
@@ -1,23 +1,58 @@
+from collections import defaultdict
+
+from intervaltree import IntervalTree
+
+
+def _chunk_bounds(chunk):
+    timestamp = chunk.get("timestamp")
+
+    # Fallback handling if "timestamp" key is missing or None
+    if timestamp is not None:
+        return timestamp[0], timestamp[1]
+    # Use safe .get() with defaults instead of direct indexing
+    return chunk.get("start", 0), chunk.get("end", 0)
+
+
+def _point_hits(tree, ends_at, t):
+    """Segments containing time `t`, inclusive of both ends.
+
+    `tree.at` is half-open, so segments ending exactly at `t` come from `ends_at`.
+    """
+    return tree.at(t) | ends_at.get(t, set())
+
+
 def align_transcript_with_speakers(transcript_chunks, diarization_segments):
     aligned = []
 
+    # Segments may overlap and chunks may straddle turn boundaries, so index the
+    # diarization once and give each chunk the speaker it overlaps the most.
+    tree = IntervalTree()
+    ends_at = defaultdict(set)
+    for segment in diarization_segments:
+        if segment["end"] > segment["start"]:
+            tree.addi(segment["start"], segment["end"], segment["speaker"])
+    for iv in tree:
+        ends_at[iv.end].add(iv)
+
     for chunk in transcript_chunks:
-        timestamp = chunk.get("timestamp")
+        chunk_start, chunk_end = _chunk_bounds(chunk)
 
-        # Fallback handling if "timestamp" key is missing or None
-        if timestamp is not None:
-            chunk_start, chunk_end = timestamp
+        # Zero-length or open-ended chunks are matched on their start point only
+        if chunk_end is None or chunk_end <= chunk_start:
+            query_end = chunk_start
+            hits = _point_hits(tree, ends_at, chunk_start)
         else:
-            # Use safe .get() with defaults instead of direct indexing
-            chunk_start = chunk.get("start", 0)
-            chunk_end = chunk.get("end", 0)
+            query_end = chunk_end
+            # A chunk starting exactly where a segment ends still belongs to it
+            hits = tree.overlap(chunk_start, chunk_end) or _point_hits(tree, ends_at, chunk_start)
 
-        # Find speaker segment matching this time range
         speaker_label = "unknown"
-        for segment in diarization_segments:
-            if segment["start"] <= chunk_start <= segment["end"]:
-                speaker_label = segment["speaker"]
-                break
+        if hits:
+            best = max(
+                hits,
+                key=lambda iv: (min(iv.end, query_end) - max(iv.begin, chunk_start), -iv.begin),
+            )
+            speaker_label = best.data
 
         aligned.append({
             "start": chunk_start,
@@ -33,7 +68,4 @@ def format_conversation(conversation):
     """
     Returns a human-readable conversation string.
     """
-    lines = []
-    for turn in conversation:
-        lines.append(f"{turn['speaker']}: {turn['text']}")
-    return "\n".join(lines)
+    return "\n".join(f"{turn['speaker']}: {turn['text']}" for turn in conversation)
@@ -1,52 +1,82 @@
+import contextlib
+import functools
 import os
 import torch
-import torchaudio
-import tempfile
 from pyannote.audio import Pipeline
+from .audio import load_audio
+
+@functools.lru_cache(maxsize=1)
+def _load_pipeline(access_token, device, embedding_batch_size, segmentation_batch_size):
+    """Load the pyannote pipeline once per process and share it across instances.
+
+    Everything that configures the shared pipeline is part of the cache key, so
+    instances built with different settings never reconfigure each other.
+    """
+    pipeline = Pipeline.from_pretrained(
+        "pyannote/speaker-diarization-3.1",
+        use_auth_token=access_token,
+    )
+    # pyannote defaults to 32; smaller batches keep mid-range GPUs out of VRAM paging
+    pipeline.embedding_batch_size = embedding_batch_size
+    pipeline.segmentation_batch_size = segmentation_batch_size
+    # Move the loaded weights explicitly; a default device only affects new tensors
+    pipeline.to(torch.device(device))
+    return pipeline
 
 class DiarizationModel:
-    def __init__(self, access_token, num_speakers=1, device: str = "cpu"):
+    def __init__(
+        self,
+        access_token,
+        *,
+        device: str = "cpu",
+        embedding_batch_size: int = 8,
+        segmentation_batch_size: int = 8,
+    ):
+        self.device = "cpu"
         try:
             # Force CPU by default; allow override via argument or env DIAR_DEVICE
             device = os.getenv("DIAR_DEVICE", device).lower()
+            self.device = device
 
             if device == "cpu":
                 # Hide GPUs from PyTorch/pyannote to ensure CPU execution
                 os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
 
-            # No need to set global default device; rely on CPU-only visibility
-            self.pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=access_token,
+            self.pipeline = _load_pipeline(
+                access_token, device, embedding_batch_size, segmentation_batch_size
             )
-            self.num_speakers = num_speakers
+            if self.device.startswith("cuda"):
+                # Let cuDNN pick the fastest conv kernels for the segmentation model
+                torch.backends.cudnn.benchmark = True
         except Exception as e:
             print(f"Error loading pyannote pipeline: {e}")
             self.pipeline = None
 
-    def diarize(self, audio_bytes):
+    def diarize(self, audio, num_speakers=1):
+        """Diarize raw audio bytes or a preloaded dict from `load_audio`."""
         if self.pipeline is None:
             raise ValueError("Diarization pipeline is not initialized.")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_bytes)
-            temp_file_path = temp_file.name
-
-        waveform, rate = torchaudio.load(temp_file_path)
-        if rate != 16000:
-            resampler = torchaudio.transforms.Resample(orig_freq=rate, new_freq=16000)
-            waveform = resampler(waveform)
-        mono_waveform = waveform.mean(dim=0, keepdim=True)  # shape: (1, time)
+        # Resample and downmix on the device the pipeline runs on
+        if not isinstance(audio, dict):
+            audio = load_audio(audio, device=self.device)
 
 
         def progress_callback(progress):
             print(f"Diarization progress: {progress * 100:.2f}%")
 
-        diarization = self.pipeline(
-            {"waveform": mono_waveform, "sample_rate": 16000},
-            num_speakers=self.num_speakers,
-            # progress_hook=progress_callback
-        )
+        # fp16 autocast routes segmentation/embedding matmuls through Tensor Cores
+        if self.device.startswith("cuda"):
+            precision = torch.autocast("cuda", dtype=torch.float16)
+        else:
+            precision = contextlib.nullcontext()
+
+        with precision:
+            diarization = self.pipeline(
+                audio,
+                num_speakers=num_speakers,
+                # progress_hook=progress_callback
+            )
 
         segments = []
         for turn, _, speaker in diarization.itertracks(yield_label=True):
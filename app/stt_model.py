@@ -1,11 +1,9 @@
 import os
-import torchaudio
-from transformers import pipeline
-import torch
-import tempfile
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from .audio import load_audio
 
 class STTModel:
-    def __init__(self, model_name="openai/whisper-medium", device=None):
+    def __init__(self, model_name="medium", device=None, quantize: bool = True, batch_size: int = 8):
         # Allow cloud overrides via environment variables
         env_model_name = os.getenv("ASR_MODEL_NAME")
         local_dir = os.getenv("ASR_MODEL_LOCAL_DIR")
@@ -19,31 +17,41 @@ class STTModel:
         if device is None:
             device = os.getenv("ASR_DEVICE", "cpu").lower()
 
-        device_index = -1 if device == "cpu" else 0
-
-        self.pipe = pipeline(
-            "automatic-speech-recognition",
-            model=model_path,
-            device=device_index,
+        # CTranslate2 converts weights at load time; int8 GEMMs on CPU, int8 weights
+        # with fp16 activations on GPU
+        if quantize:
+            compute_type = "int8" if device == "cpu" else "int8_float16"
+        else:
+            compute_type = "default"
+
+        self.device = device
+        self.batch_size = batch_size
+        # The batched pipeline runs Silero VAD first, packs speech into <=30s windows
+        # and decodes them in batches, so silence never reaches the decoder
+        self.pipe = BatchedInferencePipeline(
+            model=WhisperModel(model_path, device=device, compute_type=compute_type)
         )
 
-    def transcribe(self, audio_bytes) -> list:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_bytes)
-            temp_file_path = temp_file.name
-
-        waveform, rate = torchaudio.load(temp_file_path)
-
-        if rate != 16000:
-            resampler = torchaudio.transforms.Resample(orig_freq=rate, new_freq=16000)
-            waveform = resampler(waveform)
-
-        # Convert to mono if needed
-        audio = waveform.mean(dim=0).numpy()
-
-        # Run transcription with timestamp output
-        result = self.pipe(audio, return_timestamps="chunks", generate_kwargs={"language": "en", "task": "transcribe"})
+    def transcribe(self, audio) -> list:
+        """Transcribe raw audio bytes or a preloaded dict from `load_audio`."""
+        if not isinstance(audio, dict):
+            # Resample and downmix next to the model instead of pegging a CPU core
+            audio = load_audio(audio, device=self.device)
+
+        # faster-whisper takes a 1-D numpy array
+        audio = audio["waveform"][0].cpu().numpy()
+
+        # Run transcription; timestamps are mapped back onto the original audio.
+        # The batched pipeline defaults to without_timestamps=True, which returns one
+        # segment per 30s window; keep timestamp tokens for sentence-level segments.
+        segments, _ = self.pipe.transcribe(
+            audio,
+            language="en",
+            word_timestamps=False,
+            without_timestamps=False,
+            vad_filter=True,
+            chunk_length=30,
+            batch_size=self.batch_size,
+        )
 
-        if "chunks" not in result:
-            raise ValueError("Transcription result does not contain 'chunks'.")
-        return result["chunks"]
+        return [{"timestamp": (s.start, s.end), "text": s.text} for s in segments]
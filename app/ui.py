@@ -1,5 +1,10 @@
 import streamlit as st
+import contextlib
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from .audio import load_audio
 from .diarization import DiarizationModel
 from .conversation_builder import align_transcript_with_speakers, format_conversation
 from .summary import ConversationSummarizer
@@ -22,6 +27,27 @@ def load_hf_token(token_file_path="conf/hf_token.txt"):
         print("Unable to read the token.")
         return None
 
+@st.cache_resource
+def get_diarizer(access_token):
+    """Load the diarization pipeline once and keep it resident across reruns."""
+    diarizer = DiarizationModel(access_token=access_token)
+    # Raise instead of caching a dead model; cache_resource does not cache
+    # exceptions, so the next Process click retries the load
+    if diarizer.pipeline is None:
+        raise RuntimeError("Diarization pipeline failed to load.")
+    return diarizer
+
+@st.cache_resource
+def get_summarizer():
+    """Load the summarization model once and keep it resident across reruns."""
+    return ConversationSummarizer()
+
+def _submit(executor, fn, *args):
+    """Start `fn` on `executor`, or defer it until `.result()` when executor is None."""
+    if executor is not None:
+        return executor.submit(fn, *args)
+    return SimpleNamespace(result=functools.partial(fn, *args))
+
 def render_ui(stt_model):
     st.title("Speech-to-Text with Speaker Diarization")
     st.caption("Transcribe audio, attribute speakers, and summarize the conversation.")
@@ -58,27 +84,51 @@ def render_ui(stt_model):
 
             # Diarization (optional)
             diarization_segments = []
+            diarizer = None
             if enable_diarization:
                 if not hf_token:
                     st.error("Missing HF token. Skipping diarization.")
                 else:
+                    try:
+                        diarizer = get_diarizer(hf_token)
+                    except Exception as e:
+                        st.error(f"Diarization failed: {e}")
+
+            # Decode and resample once; diarization and transcription share the waveform.
+            # Resample on the GPU only if one of the models consumes it there.
+            use_cuda = any(model.device.startswith("cuda") for model in (stt_model, diarizer) if model)
+            with st.spinner("Decoding audio..."):
+                try:
+                    audio = load_audio(audio_bytes, device="cuda" if use_cuda else "cpu")
+                except Exception as e:
+                    st.error(f"Could not decode audio: {e}")
+                    return
+
+            # Diarization and transcription share no state, so overlap them when a model
+            # runs on CUDA. On CPU the CTranslate2 and torch thread pools already span every
+            # core, so they run one after the other. Streamlit calls stay on this thread.
+            parallel = ThreadPoolExecutor(max_workers=2) if use_cuda else contextlib.nullcontext()
+            with parallel as executor:
+                diarization_future = _submit(executor, diarizer.diarize, audio, num_speakers) if diarizer else None
+                transcription_future = _submit(executor, stt_model.transcribe, audio)
+
+                if diarization_future is not None:
                     with st.spinner("Diarizing speakers (pyannote)..."):
                         try:
-                            diarizer = DiarizationModel(access_token=hf_token, num_speakers=num_speakers)
-                            diarization_segments = diarizer.diarize(audio_bytes)
+                            diarization_segments = diarization_future.result()
                             st.success("Diarization complete")
                         except Exception as e:
                             st.error(f"Diarization failed: {e}")
                             diarization_segments = []
 
-            # Transcription
-            with st.spinner("Transcribing audio (Whisper)..."):
-                try:
-                    transcript_chunks = stt_model.transcribe(audio_bytes)
-                    st.success("Transcription complete")
-                except Exception as e:
-                    st.error(f"Transcription failed: {e}")
-                    return
+                # Transcription
+                with st.spinner("Transcribing audio (Whisper)..."):
+                    try:
+                        transcript_chunks = transcription_future.result()
+                        st.success("Transcription complete")
+                    except Exception as e:
+                        st.error(f"Transcription failed: {e}")
+                        return
 
             # Alignment
             with st.spinner("Aligning transcript with speakers..."):
@@ -87,15 +137,16 @@ def render_ui(stt_model):
                         conversation = align_transcript_with_speakers(transcript_chunks, diarization_segments)
                     else:
                         # No diarization: attribute all to a single speaker
-                        conversation = [
-                            {
-                                "start": ch.get("timestamp", [0, 0])[0] if ch.get("timestamp") else ch.get("start", 0),
-                                "end": ch.get("timestamp", [0, 0])[1] if ch.get("timestamp") else ch.get("end", 0),
+                        conversation = []
+                        for ch in transcript_chunks:
+                            ts = ch.get("timestamp")
+                            start, end = (ts[0], ts[1]) if ts else (ch.get("start", 0), ch.get("end", 0))
+                            conversation.append({
+                                "start": start,
+                                "end": end,
                                 "speaker": "Speaker",
                                 "text": ch.get("text", ""),
-                            }
-                            for ch in transcript_chunks
-                        ]
+                            })
                     conversation_text = format_conversation(conversation)
                     st.success("Alignment complete")
                 except Exception as e:
@@ -105,7 +156,7 @@ def render_ui(stt_model):
             # Summarization
             with st.spinner("Generating summary..."):
                 try:
-                    summarizer = ConversationSummarizer()
+                    summarizer = get_summarizer()
                     summary = summarizer.summarize(conversation_text)
                     st.success("Summary generated")
                 except Exception as e:
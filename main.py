@@ -1,11 +1,18 @@
 """Streamlit Main Entry Point."""
 
+import streamlit as st
+
 from app.stt_model import STTModel
 from app.ui import render_ui
 
+@st.cache_resource
+def get_stt_model() -> STTModel:
+    """Load the Whisper model once per process instead of on every rerun."""
+    return STTModel()
+
 def main() -> None:
     """Main function to run the Streamlit app."""
-    stt_model = STTModel()
+    stt_model = get_stt_model()
     render_ui(stt_model=stt_model)
 
 if __name__ == "__main__":
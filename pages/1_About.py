@@ -16,7 +16,7 @@ conversation.
 
 Features:
 - Upload audio files (`.wav`, `.mp3`, `.m4a`).
-- Transcribe using Whisper via Hugging Face `transformers`.
+- Transcribe using Whisper via `faster-whisper` (CTranslate2, int8).
 - Optional speaker diarization powered by `pyannote.audio` (requires a Hugging Face token).
 - Automatic conversation alignment and clean formatting.
 - Summarization using a local BART CNN model for offline-friendly usage.
@@ -38,6 +38,6 @@ Deployment notes:
 
 st.info(
     "Tip: For faster cold starts in the cloud, prefer smaller ASR models like "
-    "`openai/whisper-small` or vendor the model assets and use `ASR_MODEL_LOCAL_DIR`."
+    "`small` or vendor the model assets and use `ASR_MODEL_LOCAL_DIR`."
 )
 
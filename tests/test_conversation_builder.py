@@ -0,0 +1,56 @@
+"""Test cases for conversation alignment."""
+
+from app.conversation_builder import align_transcript_with_speakers
+
+
+def test_align_transcript_with_speakers():
+    """Chunks take the speaker of the segment they overlap the most."""
+    chunks = [
+        {"timestamp": (0.5, 2.0), "text": "hello"},
+        {"timestamp": (3.0, 4.0), "text": "there"},
+        {"start": 6.0, "end": 7.0, "text": "gap"},
+    ]
+    segments = [
+        {"start": 0.0, "end": 2.5, "speaker": "SPEAKER_00"},
+        {"start": 2.5, "end": 5.0, "speaker": "SPEAKER_01"},
+    ]
+
+    result = align_transcript_with_speakers(chunks, segments)
+    assert [turn["speaker"] for turn in result] == ["SPEAKER_00", "SPEAKER_01", "unknown"]
+    assert result[2]["start"] == 6.0
+
+
+def test_align_picks_max_overlap():
+    """A chunk straddling a turn boundary goes to the speaker it overlaps most."""
+    chunks = [{"timestamp": (1.5, 4.5), "text": "mostly second speaker"}]
+    segments = [
+        {"start": 0.0, "end": 2.0, "speaker": "SPEAKER_00"},
+        {"start": 1.8, "end": 5.0, "speaker": "SPEAKER_01"},
+    ]
+
+    result = align_transcript_with_speakers(chunks, segments)
+    assert result[0]["speaker"] == "SPEAKER_01"
+
+
+def test_align_without_segments():
+    """Every chunk is unknown when diarization produced nothing."""
+    result = align_transcript_with_speakers([{"timestamp": (0.0, 1.0), "text": "hi"}], [])
+    assert result[0]["speaker"] == "unknown"
+
+
+def test_align_zero_length_chunk_at_segment_end():
+    """A zero-length chunk on a segment's end boundary still gets that speaker."""
+    chunks = [{"timestamp": (10.0, 10.0), "text": "edge"}]
+    segments = [{"start": 0.0, "end": 10.0, "speaker": "SPEAKER_00"}]
+
+    result = align_transcript_with_speakers(chunks, segments)
+    assert result[0]["speaker"] == "SPEAKER_00"
+
+
+def test_align_chunk_starting_at_segment_end():
+    """A chunk starting on a segment's end boundary gets that speaker."""
+    chunks = [{"timestamp": (10.0, 12.0), "text": "edge"}]
+    segments = [{"start": 0.0, "end": 10.0, "speaker": "SPEAKER_00"}]
+
+    result = align_transcript_with_speakers(chunks, segments)
+    assert result[0]["speaker"] == "SPEAKER_00"
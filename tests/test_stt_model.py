@@ -1,8 +1,11 @@
 """Test cases for STTModel."""
 
 import io
+from types import SimpleNamespace
+
 import numpy as np
 import soundfile as sf
+import app.stt_model as stt_module
 from app.stt_model import STTModel
 
 
@@ -10,17 +13,27 @@ def test_transcribe_dummy(monkeypatch):
     """Test the transcribe method with a dummy audio input."""
 
     class DummyPipe:
-        def __call__(self, audio, sampling_rate=None):
-            return {"text": "dummy transcript"}
+        def __init__(self, model):
+            self.model = model
+            self.kwargs = None
+
+        def transcribe(self, audio, **kwargs):
+            self.kwargs = kwargs
+            segments = iter([SimpleNamespace(start=0.0, end=1.0, text="dummy transcript")])
+            return segments, None
 
-    stt = STTModel()
-    stt._pipe = DummyPipe()
+    monkeypatch.setattr(stt_module, "WhisperModel", lambda *args, **kwargs: None)
+    monkeypatch.setattr(stt_module, "BatchedInferencePipeline", DummyPipe)
+    stt = STTModel(device="cpu", batch_size=4)
 
     # Create a dummy audio file in memory
     audio_array = np.zeros(16000)
     buf = io.BytesIO()
     sf.write(buf, audio_array, 16000, format="WAV")
-    buf.seek(0)
 
-    result = stt.transcribe(buf)
-    assert result == "dummy transcript"
\ No newline at end of file
+    result = stt.transcribe(buf.getvalue())
+    assert result == [{"timestamp": (0.0, 1.0), "text": "dummy transcript"}]
+    assert stt.pipe.kwargs["vad_filter"] is True
+    assert stt.pipe.kwargs["chunk_length"] == 30
+    assert stt.pipe.kwargs["batch_size"] == 4
+    assert stt.pipe.kwargs["without_timestamps"] is False
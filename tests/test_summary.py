@@ -0,0 +1,64 @@
+"""Test cases for ConversationSummarizer."""
+
+import sys
+
+from app.summary import ConversationSummarizer
+
+
+class DummyTokenizer:
+    model_max_length = 1024
+
+    def __call__(self, lines, add_special_tokens=False):
+        # Lines cost 600 tokens against a 900-token budget, so each line of the
+        # test lands in its own chunk.
+        return {"input_ids": [[0] * 600 for _ in lines]}
+
+
+class DummyPipe:
+    """Stub pipeline; `batched` sets the shape of list-input results."""
+
+    tokenizer = DummyTokenizer()
+
+    def __init__(self, batched="dict", fail_on=()):
+        self.batched = batched
+        self.fail_on = fail_on
+
+    def __call__(self, inputs, **kwargs):
+        if isinstance(inputs, list):
+            if self.batched == "raise":
+                raise RuntimeError("batched call failed")
+            if self.batched == "list":
+                return [[{"summary_text": f"sum {x}"}] for x in inputs]
+            return [{"summary_text": f"sum {x}"} for x in inputs]
+        if inputs in self.fail_on:
+            raise RuntimeError("chunk failed")
+        return [{"summary_text": f"sum {inputs}"}]
+
+
+def make_summarizer(monkeypatch, pipe):
+    # Block the transformers import so __init__ skips model loading, then swap in the stub.
+    monkeypatch.setitem(sys.modules, "transformers", None)
+    summarizer = ConversationSummarizer()
+    summarizer._pipe = pipe
+    return summarizer
+
+
+TEXT = "\n".join(["A: one", "B: two", "A: three", "B: four"])
+
+
+def test_summarize_batched_list_of_dict(monkeypatch):
+    """Chunk summaries come from a list-of-dict batched result."""
+    summarizer = make_summarizer(monkeypatch, DummyPipe(batched="dict"))
+    assert summarizer.summarize(TEXT) == "sum sum A: one\nsum B: two\nsum A: three\nsum B: four"
+
+
+def test_summarize_batched_list_of_list(monkeypatch):
+    """Chunk summaries come from a list-of-list batched result."""
+    summarizer = make_summarizer(monkeypatch, DummyPipe(batched="list"))
+    assert summarizer.summarize(TEXT) == "sum sum A: one\nsum B: two\nsum A: three\nsum B: four"
+
+
+def test_summarize_falls_back_per_chunk(monkeypatch):
+    """A failing batched call retries each chunk; only failing chunks are truncated."""
+    summarizer = make_summarizer(monkeypatch, DummyPipe(batched="raise", fail_on=("B: two",)))
+    assert summarizer.summarize(TEXT) == "sum sum A: one\nB: two\nsum A: three\nsum B: four"